@@ -36,6 +36,22 @@ class BuildLogParser:
         """
         self.build_log_path = build_log_path
         self.log_content = ""
+        self._content_loaded = False
+
+    @classmethod
+    def from_text(cls, text: str) -> "BuildLogParser":
+        """Create a parser for build log content that is already in memory.
+
+        Args:
+            text: Build log content
+
+        Returns:
+            BuildLogParser that parses the given text instead of reading a file
+        """
+        parser = cls(Path("<text>"))
+        parser.log_content = text
+        parser._content_loaded = True
+        return parser
 
     def parse(self) -> BuildLogInfo:
         """Parse the build log and extract compiler information.
@@ -56,11 +72,15 @@ class BuildLogParser:
 
     def _read_log_file(self) -> None:
         """Read the build log file content."""
+        if self._content_loaded:
+            return
+
         if not self.build_log_path.exists():
             raise FileNotFoundError(f"Build log not found: {self.build_log_path}")
 
         with open(self.build_log_path, "r", encoding="utf-8", errors="replace") as f:
             self.log_content = f.read()
+        self._content_loaded = True
 
     def _extract_resource_compiler_path(self) -> Path | None:
         """Extract cgrc.exe path from the build log.
@@ -9,7 +9,7 @@ from typing import Optional
 from src.config import ConfigLoader
 from src.dproj_parser import DProjParser
 from src.models import CompilationError, CompilationResult, CompilationStatistics
-from src.output_parser import OutputParser
+from src.output_parser import parse_compiler_output_bytes
 from src.resource_compiler import ResourceCompiler
 
 
@@ -121,8 +121,7 @@ class DelphiCompiler:
         compilation_time = time.time() - start_time
 
         # Parse output
-        parser = OutputParser()
-        errors, statistics = parser.parse(output)
+        errors, statistics = parse_compiler_output_bytes(output)
 
         # Determine output executable path
         output_exe = None
@@ -378,17 +377,19 @@ class DelphiCompiler:
 
         return merged
 
-    def _execute_compiler(self, command: list[str], working_dir: Path) -> tuple[str, int]:
+    def _execute_compiler(self, command: list[str], working_dir: Path) -> tuple[bytes, int]:
         """Execute the compiler and capture output.
 
         Uses a response file (@file.rsp) if command line is too long.
+        Output is returned undecoded; parse_compiler_output_bytes() only
+        decodes the messages it keeps.
 
         Args:
             command: Compiler command as list
             working_dir: Working directory for execution
 
         Returns:
-            Tuple of (output string, exit code)
+            Tuple of (raw output bytes, exit code)
         """
         try:
             # Check if command line is too long (Windows limit is ~8191 characters)
@@ -421,14 +422,11 @@ class DelphiCompiler:
                 actual_command,
                 cwd=str(working_dir),
                 capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
                 timeout=300,
             )
 
             # Combine stdout and stderr
-            output = result.stdout + "\n" + result.stderr
+            output = result.stdout + b"\n" + result.stderr
 
             # Clean up response file if we created one
             if response_file and response_file.exists():
@@ -437,9 +435,9 @@ class DelphiCompiler:
             return output, result.returncode
 
         except subprocess.TimeoutExpired:
-            return "Compilation timed out after 5 minutes", 1
+            return b"Compilation timed out after 5 minutes", 1
         except Exception as e:
-            return f"Compiler execution failed: {e}", 1
+            return f"Compiler execution failed: {e}".encode("utf-8", "replace"), 1
 
     def _find_output_executable(
         self, project_path: Path, dproj_settings: Optional[any], platform: str = "Win32"
@@ -1,5 +1,6 @@
 """Configuration file loading and management."""
 
+import functools
 import os
 import re
 import sys
@@ -24,6 +25,10 @@ PLATFORM_CONFIG_NAMES = {
     "Android64": "delphi_config_android64.toml",
 }
 
+# Lowercased platform name -> config filename, for case-insensitive lookup
+_PLATFORM_LOWER = {key.lower(): filename for key, filename in PLATFORM_CONFIG_NAMES.items()}
+
+
 def get_platform_config_filename(platform: str) -> str:
     """Get the platform-specific config filename.
 
@@ -33,13 +38,12 @@ def get_platform_config_filename(platform: str) -> str:
     Returns:
         Platform-specific config filename (e.g., "delphi_config_win64.toml")
     """
-    # Normalize platform name
     platform_normalized = platform.lower()
-    for key, filename in PLATFORM_CONFIG_NAMES.items():
-        if key.lower() == platform_normalized:
-            return filename
     # Fallback for unknown platforms
-    return f"delphi_config_{platform_normalized}.toml"
+    return (
+        _PLATFORM_LOWER.get(platform_normalized)
+        or f"delphi_config_{platform_normalized}.toml"
+    )
 
 
 def find_config_file_for_platform(
@@ -47,6 +51,12 @@ def find_config_file_for_platform(
 ) -> tuple[Path, str]:
     """Find the appropriate config file for a platform.
 
+    Lookups are cached per platform and directory, and invalidated when the
+    directory's modification time changes. On filesystems with coarse directory
+    timestamps, a config file created within the same timestamp tick as a cached
+    lookup is not seen until the directory changes again; call
+    clear_config_lookup_cache() to reset the cache explicitly.
+
     Search order:
     1. DELPHI_CONFIG environment variable (explicit override)
     2. Platform-specific config (e.g., delphi_config_win64.toml)
@@ -81,10 +91,45 @@ def find_config_file_for_platform(
             "(e.g., Win32, Win64, Win64x, Linux64, Android, Android64)."
         )
 
+    # Directory mtime changes whenever a config file is created or removed,
+    # so it invalidates cached lookups without re-checking each file
+    try:
+        dir_mtime_ns: Optional[int] = base_dir.stat().st_mtime_ns
+    except OSError:
+        dir_mtime_ns = None
+
+    return _find_platform_config(platform, base_dir, dir_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _find_platform_config(
+    platform: str, base_dir: Path, dir_mtime_ns: Optional[int]
+) -> tuple[Path, str]:
+    """Locate the platform-specific or generic config file in base_dir (memoized).
+
+    Args:
+        platform: Target platform
+        base_dir: Directory to search in
+        dir_mtime_ns: Modification time of base_dir, used only as cache key
+
+    Returns:
+        Tuple of (config_path, source) with source "platform" or "generic"
+
+    Raises:
+        FileNotFoundError: If no matching config file exists
+    """
+    # List the directory once instead of stat'ing each candidate; normcase
+    # keeps matching case-insensitive on Windows, as Path.exists() would be
+    try:
+        with os.scandir(base_dir) as entries:
+            names = {os.path.normcase(entry.name) for entry in entries}
+    except OSError:
+        names = set()
+
     # Search for platform-specific config
     platform_filename = get_platform_config_filename(platform)
     platform_config_path = base_dir / platform_filename
-    if platform_config_path.exists():
+    if os.path.normcase(platform_filename) in names:
         return platform_config_path, "platform"
 
     # Windows platforms can fall back to generic delphi_config.toml
@@ -92,9 +137,8 @@ def find_config_file_for_platform(
     WINDOWS_PLATFORMS = {"win32", "win64", "win64x"}
     platform_normalized = platform.lower()
     if platform_normalized in WINDOWS_PLATFORMS:
-        generic_config_path = base_dir / "delphi_config.toml"
-        if generic_config_path.exists():
-            return generic_config_path, "generic"
+        if os.path.normcase("delphi_config.toml") in names:
+            return base_dir / "delphi_config.toml", "generic"
 
     raise FileNotFoundError(
         f"Platform-specific config file not found: {platform_filename}\n"
@@ -104,6 +148,46 @@ def find_config_file_for_platform(
     )
 
 
+def clear_config_lookup_cache() -> None:
+    """Clear cached results of find_config_file_for_platform()."""
+    _find_platform_config.cache_clear()
+
+
+@functools.lru_cache(maxsize=16)
+def _load_toml(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a TOML file (memoized).
+
+    Args:
+        path_str: Path to the TOML file
+        mtime_ns: Modification time of the file, used only as cache key
+        size: File size in bytes, used only as cache key
+
+    Returns:
+        Parsed TOML document
+    """
+    with open(path_str, "rb") as f:
+        return tomllib.load(f)
+
+
+def load_toml(path: Path) -> dict[str, Any]:
+    """Load a TOML file, reusing the parsed result until the file changes.
+
+    The returned dictionary is shared between callers and must not be modified.
+
+    Args:
+        path: Path to the TOML file
+
+    Returns:
+        Parsed TOML document
+
+    Raises:
+        OSError: If the file cannot be read
+        tomllib.TOMLDecodeError: If the file is not valid TOML
+    """
+    stat = path.stat()
+    return _load_toml(str(path), stat.st_mtime_ns, stat.st_size)
+
+
 class ConfigLoader:
     """Loads and validates Delphi configuration from TOML files."""
 
@@ -146,8 +230,7 @@ class ConfigLoader:
 
         # Load TOML file
         try:
-            with open(self.config_path, "rb") as f:
-                raw_config = tomllib.load(f)
+            raw_config = load_toml(self.config_path)
         except Exception as e:
             raise ValueError(f"Invalid TOML syntax in config file: {e}")
 
@@ -1,11 +1,15 @@
 """Parser for Delphi .dproj (MSBuild) project files."""
 
+import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Optional
 
 from src.models import DProjSettings, VersionInfo
 
+# Matches an MSBuild variable reference such as $(BDS) or $(Platform)
+_MSBUILD_VAR_PATTERN = re.compile(r"\$\([^)]+\)")
+
 
 class DProjParser:
     """Parses .dproj files to extract build settings and compiler configuration."""
@@ -426,8 +430,6 @@ class DProjParser:
             return None
 
         # Substitute known MSBuild variables with their values
-        import re
-
         # Get current config/platform (set during _extract_settings)
         config = getattr(self, "_current_config", "Debug")
         platform = getattr(self, "_current_platform", "Win32")
@@ -444,7 +446,7 @@ class DProjParser:
             path_str = path_str.replace(var, value)
 
         # Remove any remaining unknown variable references
-        path_str = re.sub(r"\$\([^)]+\)", "", path_str)
+        path_str = _MSBUILD_VAR_PATTERN.sub("", path_str)
         path_str = path_str.strip()
 
         if not path_str:
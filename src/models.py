@@ -1,5 +1,6 @@
 """Data models for Delphi Build MCP Server."""
 
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Optional
@@ -387,32 +388,40 @@ class BuildLogInfo(BaseModel):
         return [Path(p) if isinstance(p, str) else p for p in v]
 
 
-class VersionInfo(BaseModel):
-    """Version information extracted from .dproj for resource compilation."""
+@dataclass(frozen=True, slots=True)
+class VersionInfo:
+    """Version information extracted from .dproj for resource compilation.
 
-    major: int = Field(default=0, description="Major version number")
-    minor: int = Field(default=0, description="Minor version number")
-    release: int = Field(default=0, description="Release version number")
-    build: int = Field(default=0, description="Build version number")
-    locale: int = Field(default=1033, description="Locale ID (default: 1033 = US English)")
-    keys: dict[str, str] = Field(
-        default_factory=dict,
-        description="Version info key-value pairs (CompanyName, FileDescription, etc.)",
-    )
+    A plain dataclass rather than a BaseModel: it is built once per parse from
+    already-typed values, so it skips Pydantic validation.
+    """
+
+    major: int = 0  # Major version number
+    minor: int = 0  # Minor version number
+    release: int = 0  # Release version number
+    build: int = 0  # Build version number
+    locale: int = 1033  # Locale ID (default: 1033 = US English)
+    # Version info key-value pairs (CompanyName, FileDescription, etc.);
+    # excluded from the hash since a dict is unhashable
+    keys: dict[str, str] = field(default_factory=dict, hash=False)
+    # Dotted version string, computed once since the version fields are frozen
+    _file_version: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_file_version", f"{self.major}.{self.minor}.{self.release}.{self.build}"
+        )
 
     @property
     def file_version_string(self) -> str:
         """Return version as dotted string (e.g., '1.2.3.4')."""
-        return f"{self.major}.{self.minor}.{self.release}.{self.build}"
+        return self._file_version
 
 
-class ResourceCompilationResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ResourceCompilationResult:
     """Result of resource compilation step."""
 
-    success: bool = Field(description="Whether resource compilation succeeded")
-    res_file: Optional[str] = Field(
-        default=None, description="Path to generated .res file if successful"
-    )
-    error_output: Optional[str] = Field(
-        default=None, description="Error output from resource compiler"
-    )
+    success: bool  # Whether resource compilation succeeded
+    res_file: Optional[str] = None  # Path to generated .res file if successful
+    error_output: Optional[str] = None  # Error output from resource compiler
@@ -3,7 +3,7 @@
 import re
 
 from src.models import CompilationError, CompilationStatistics
-from src.output_parser import OutputParser
+from src.output_parser import parse_compiler_output
 
 
 class MsBuildOutputParser:
@@ -11,7 +11,7 @@ class MsBuildOutputParser:
 
     MSBuild wraps the Delphi compiler (dcc32/dcc64) and adds its own
     output structure. This parser extracts the _PasCoreCompile section
-    and delegates to the existing OutputParser for error/warning parsing.
+    and delegates to parse_compiler_output() for error/warning parsing.
     """
 
     # MSBuild-level error pattern: "MSBUILD : error MSBXXXX: message"
@@ -43,9 +43,8 @@ class MsBuildOutputParser:
         # Normalize MSBuild format to OutputParser-compatible format
         normalized = self._normalize_dcc_output(dcc_output)
 
-        # Delegate to existing OutputParser
-        parser = OutputParser()
-        return parser.parse(normalized)
+        # Delegate to the dcc output parser
+        return parse_compiler_output(normalized)
 
     def _normalize_dcc_output(self, output: str) -> str:
         """Normalize MSBuild-wrapped dcc output to OutputParser-compatible format.
@@ -1,217 +1,230 @@
 """Parser for Delphi compiler output."""
 
 import re
-from typing import Optional
+from typing import AnyStr, Callable, Iterable, Optional
 
 from src.models import CompilationError, CompilationStatistics
 
-
-class OutputParser:
-    """Parses Delphi compiler output to extract errors and filter warnings/hints."""
-
-    # Pattern for Delphi compiler messages (English and German)
-    # Format: FileName.pas(line,col): [Error/Fehler/Warning/Warnung/Hint/Hinweis] E####: Message
-    # Example: Unit1.pas(42,15): Error: E2003 Undeclared identifier: 'Foo'
-    # Example: Unit1.pas(42,15) Fehler: E2003 Undeklarierter Bezeichner: 'Foo'
-    MESSAGE_PATTERN = re.compile(
-        r"^(.+?)\((\d+)(?:,(\d+))?\)\s*(Error|Warning|Hint|Fatal|Fehler|Warnung|Hinweis|Schwerwiegend)(?:\s*:)?\s*([EWHFewh]\d+)?\s*:?\s*(.+)$",
-        re.IGNORECASE
-    )
-
-    # Alternative pattern for messages without file location (English and German)
-    # Example: Fatal: F1026 File not found: 'System.pas'
-    # Example: Schwerwiegend: F1026 Datei nicht gefunden: 'System.pas'
-    SIMPLE_MESSAGE_PATTERN = re.compile(
-        r"^(Error|Warning|Hint|Fatal|Fehler|Warnung|Hinweis|Schwerwiegend)\s*:?\s*([EWHFewh]\d+)?\s*:?\s*(.+)$",
-        re.IGNORECASE
+# Pattern for Delphi compiler messages (English and German)
+# Format: FileName.pas(line,col): [Error/Fehler/Warning/Warnung/Hint/Hinweis] E####: Message
+# Example: Unit1.pas(42,15): Error: E2003 Undeclared identifier: 'Foo'
+# Example: Unit1.pas(42,15) Fehler: E2003 Undeklarierter Bezeichner: 'Foo'
+MESSAGE_PATTERN = re.compile(
+    r"^(.+?)\((\d+)(?:,(\d+))?\)\s*(Error|Warning|Hint|Fatal|Fehler|Warnung|Hinweis|Schwerwiegend)(?:\s*:)?\s*([EWHFewh]\d+)?\s*:?\s*(.+)$",
+    re.IGNORECASE
+)
+
+# Alternative pattern for messages without file location (English and German)
+# Example: Fatal: F1026 File not found: 'System.pas'
+# Example: Schwerwiegend: F1026 Datei nicht gefunden: 'System.pas'
+SIMPLE_MESSAGE_PATTERN = re.compile(
+    r"^(Error|Warning|Hint|Fatal|Fehler|Warnung|Hinweis|Schwerwiegend)\s*:?\s*([EWHFewh]\d+)?\s*:?\s*(.+)$",
+    re.IGNORECASE
+)
+
+# Lines compiled summary
+# Example: 12345 lines, 2.5 seconds
+LINES_PATTERN = re.compile(r"(\d+)\s+lines?", re.IGNORECASE)
+
+# Bytes variants of the patterns above, for parsing undecoded subprocess output
+BYTES_MESSAGE_PATTERN = re.compile(MESSAGE_PATTERN.pattern.encode("ascii"), re.IGNORECASE)
+BYTES_SIMPLE_MESSAGE_PATTERN = re.compile(
+    SIMPLE_MESSAGE_PATTERN.pattern.encode("ascii"), re.IGNORECASE
+)
+BYTES_LINES_PATTERN = re.compile(LINES_PATTERN.pattern.encode("ascii"), re.IGNORECASE)
+
+# Message kinds
+_ERROR = "error"
+_WARNING = "warning"
+_HINT = "hint"
+
+# Message kind by error code letter (E/F/W/H####), keyed on the raw first
+# character so str and bytes codes are classified without decoding
+_CODE_KINDS = {
+    key: kind
+    for letter, kind in (("E", _ERROR), ("F", _ERROR), ("W", _WARNING), ("H", _HINT))
+    for key in (letter, letter.lower(), letter.encode("ascii"), letter.lower().encode("ascii"))
+}
+
+# Message kind by lowercased severity keyword (English and German), used when no
+# error code is present
+_SEVERITY_KINDS = {
+    "error": _ERROR,
+    "fehler": _ERROR,
+    "fatal": _ERROR,
+    "schwerwiegend": _ERROR,
+    "warning": _WARNING,
+    "warnung": _WARNING,
+    "hint": _HINT,
+    "hinweis": _HINT,
+}
+
+
+def parse_compiler_output(output: str) -> tuple[list[CompilationError], CompilationStatistics]:
+    """Parse compiler output and extract errors.
+
+    Warnings and hints are filtered out and only counted in the statistics.
+
+    Args:
+        output: Raw compiler output text
+
+    Returns:
+        Tuple of (errors list, statistics)
+    """
+    return _parse_lines(
+        output.split("\n"),
+        MESSAGE_PATTERN.match,
+        SIMPLE_MESSAGE_PATTERN.match,
+        LINES_PATTERN.search,
+        str,
     )
 
-    def __init__(self):
-        """Initialize output parser."""
-        self.errors: list[CompilationError] = []
-        self.statistics = CompilationStatistics()
-
-    def parse(self, output: str) -> tuple[list[CompilationError], CompilationStatistics]:
-        """Parse compiler output and extract errors.
-
-        Args:
-            output: Raw compiler output text
-
-        Returns:
-            Tuple of (errors list, statistics)
-        """
-        lines = output.split("\n")
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+def parse_compiler_output_bytes(
+    output: bytes,
+) -> tuple[list[CompilationError], CompilationStatistics]:
+    """Parse raw (undecoded) compiler output and extract errors.
 
-            self._parse_line(line)
+    Matches on the bytes directly and only decodes the fields of messages
+    that are actually matched, skipping a full decode pass over large
+    build logs.
 
-        return self.errors, self.statistics
+    Args:
+        output: Raw compiler output as captured from the subprocess
 
-    def _parse_line(self, line: str) -> None:
-        """Parse a single line of compiler output.
+    Returns:
+        Tuple of (errors list, statistics)
+    """
+    return _parse_lines(
+        output.split(b"\n"),
+        BYTES_MESSAGE_PATTERN.match,
+        BYTES_SIMPLE_MESSAGE_PATTERN.match,
+        BYTES_LINES_PATTERN.search,
+        _decode_utf8,
+    )
 
-        Args:
-            line: Single line from compiler output
-        """
-        # Try full pattern first (with file location)
-        match = self.MESSAGE_PATTERN.match(line)
 
+def _decode_utf8(value: bytes) -> str:
+    """Decode a matched bytes field, replacing invalid UTF-8 sequences."""
+    return value.decode("utf-8", "replace")
+
+
+def _parse_lines(
+    lines: Iterable[AnyStr],
+    message_match: Callable[[AnyStr], Optional[re.Match[AnyStr]]],
+    simple_match: Callable[[AnyStr], Optional[re.Match[AnyStr]]],
+    lines_search: Callable[[AnyStr], Optional[re.Match[AnyStr]]],
+    decode: Callable[[AnyStr], str],
+) -> tuple[list[CompilationError], CompilationStatistics]:
+    """Shared parse loop for str and bytes compiler output.
+
+    Args:
+        lines: Output lines, either all str or all bytes
+        message_match: Match function of the message pattern (with file location)
+        simple_match: Match function of the simple message pattern
+        lines_search: Search function of the lines compiled pattern
+        decode: Converts a matched field to str
+
+    Returns:
+        Tuple of (errors list, statistics)
+    """
+    errors: list[CompilationError] = []
+    statistics = CompilationStatistics()
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        # Try full pattern first (with file location), then simple pattern
+        match = message_match(line)
         if match:
-            file_path = match.group(1)
-            line_num = int(match.group(2))
-            col_num = int(match.group(3)) if match.group(3) else 0
-            severity = match.group(4)
-            error_code = match.group(5)
-            message = match.group(6)
-
-            self._process_message(
-                severity=severity,
-                error_code=error_code,
-                message=message,
-                file_path=file_path,
-                line_num=line_num,
-                col_num=col_num,
+            file_path, line_num, col_num, severity, error_code, message = match.groups()
+        else:
+            match = simple_match(line)
+            if not match:
+                # Check for lines compiled info
+                lines_match = lines_search(line)
+                if lines_match:
+                    statistics.lines_compiled = int(lines_match.group(1))
+                continue
+            severity, error_code, message = match.groups()
+            file_path, line_num, col_num = None, 0, 0
+
+        kind = _message_kind(error_code, severity, decode)
+        if kind == _WARNING:
+            statistics.warnings_filtered += 1
+        elif kind == _HINT:
+            statistics.hints_filtered += 1
+        elif kind == _ERROR:
+            # Only decode the fields of messages that are kept
+            errors.append(
+                CompilationError(
+                    file=decode(file_path) if file_path else "(unknown)",
+                    line=int(line_num),
+                    column=int(col_num) if col_num else 0,
+                    message=decode(message.strip()),
+                    error_code=decode(error_code).upper() if error_code else None,
+                )
             )
-            return
 
-        # Try simple pattern (without file location)
-        match = self.SIMPLE_MESSAGE_PATTERN.match(line)
+    return errors, statistics
 
-        if match:
-            severity = match.group(1)
-            error_code = match.group(2)
-            message = match.group(3)
-
-            self._process_message(
-                severity=severity,
-                error_code=error_code,
-                message=message,
-                file_path="",
-                line_num=0,
-                col_num=0,
-            )
-            return
-
-        # Check for lines compiled info
-        # Format: "12345 lines, 2.5 seconds"
-        lines_match = re.search(r"(\d+)\s+lines?", line, re.IGNORECASE)
-        if lines_match:
-            self.statistics.lines_compiled = int(lines_match.group(1))
-
-    def _process_message(
-        self,
-        severity: str,
-        error_code: Optional[str],
-        message: str,
-        file_path: str,
-        line_num: int,
-        col_num: int,
-    ) -> None:
-        """Process a compiler message and decide whether to include it.
 
-        Args:
-            severity: Message severity (Error, Warning, Hint, Fatal)
-            error_code: Error code (e.g., "E2003", "W1011", "H2443")
-            message: Error message text
-            file_path: Source file path
-            line_num: Line number
-            col_num: Column number
-        """
-        # Normalize error code
-        if error_code:
-            error_code = error_code.upper()
-
-        # Determine message type based on severity and error code
-        is_error = self._is_error(severity, error_code)
-        is_warning = self._is_warning(severity, error_code)
-        is_hint = self._is_hint(severity, error_code)
-
-        # Update statistics
-        if is_warning:
-            self.statistics.warnings_filtered += 1
-            return  # Filter out warnings
-
-        if is_hint:
-            self.statistics.hints_filtered += 1
-            return  # Filter out hints
-
-        # Only keep errors and fatal errors
-        if is_error:
-            error = CompilationError(
-                file=file_path or "(unknown)",
-                line=line_num,
-                column=col_num,
-                message=message.strip(),
-                error_code=error_code,
-            )
-            self.errors.append(error)
+def _message_kind(
+    error_code: Optional[AnyStr], severity: AnyStr, decode: Callable[[AnyStr], str]
+) -> Optional[str]:
+    """Classify a compiler message as an error, warning or hint.
 
-    def _is_error(self, severity: str, error_code: Optional[str]) -> bool:
-        """Check if message is an error.
+    Args:
+        error_code: Raw error code (e.g., "E2003", "W1011", "H2443"), if present
+        severity: Raw message severity (English or German)
+        decode: Converts the severity to str when there is no error code
 
-        Args:
-            severity: Message severity (English or German)
-            error_code: Error code
+    Returns:
+        The message kind, or None if the severity is not recognized
+    """
+    # Error codes (E/F/W/H####) are unambiguous, so classify on the code letter
+    # and only fall back to the (localized) severity keyword when it is absent
+    if error_code:
+        return _CODE_KINDS.get(error_code[:1])
+    return _SEVERITY_KINDS.get(decode(severity).lower())
 
-        Returns:
-            True if message is an error
-        """
-        severity_lower = severity.lower()
 
-        # Fatal is always an error (English: "fatal", German: "schwerwiegend")
-        if severity_lower in ("fatal", "schwerwiegend"):
-            return True
+class OutputParser:
+    """Parses Delphi compiler output to extract errors and filter warnings/hints.
 
-        # Error severity (English: "error", German: "fehler")
-        if severity_lower in ("error", "fehler"):
-            return True
+    Thin wrapper around parse_compiler_output() kept for backward compatibility.
+    """
 
-        # Error codes starting with E or F
-        if error_code and error_code[0] in ("E", "F"):
-            return True
+    MESSAGE_PATTERN = MESSAGE_PATTERN
+    SIMPLE_MESSAGE_PATTERN = SIMPLE_MESSAGE_PATTERN
 
-        return False
+    def __init__(self):
+        """Initialize output parser."""
+        self.errors: list[CompilationError] = []
+        self.statistics = CompilationStatistics()
 
-    def _is_warning(self, severity: str, error_code: Optional[str]) -> bool:
-        """Check if message is a warning.
+    def parse(self, output: str) -> tuple[list[CompilationError], CompilationStatistics]:
+        """Parse compiler output and extract errors.
 
         Args:
-            severity: Message severity (English or German)
-            error_code: Error code
+            output: Raw compiler output text
 
         Returns:
-            True if message is a warning
+            Tuple of (errors list, statistics)
         """
-        # Warning severity (English: "warning", German: "warnung")
-        if severity.lower() in ("warning", "warnung"):
-            return True
-
-        # Warning codes starting with W
-        if error_code and error_code[0] == "W":
-            return True
-
-        return False
+        self.errors, self.statistics = parse_compiler_output(output)
+        return self.errors, self.statistics
 
-    def _is_hint(self, severity: str, error_code: Optional[str]) -> bool:
-        """Check if message is a hint.
+    def parse_bytes(self, output: bytes) -> tuple[list[CompilationError], CompilationStatistics]:
+        """Parse raw compiler output bytes and extract errors.
 
         Args:
-            severity: Message severity (English or German)
-            error_code: Error code
+            output: Raw compiler output as captured from the subprocess
 
         Returns:
-            True if message is a hint
+            Tuple of (errors list, statistics)
         """
-        # Hint severity (English: "hint", German: "hinweis")
-        if severity.lower() in ("hint", "hinweis"):
-            return True
-
-        # Hint codes starting with H
-        if error_code and error_code[0] == "H":
-            return True
-
-        return False
+        self.errors, self.statistics = parse_compiler_output_bytes(output)
+        return self.errors, self.statistics
@@ -2,6 +2,7 @@
 
 import re
 import winreg
+from contextlib import closing
 from pathlib import Path
 from typing import Optional
 
@@ -24,6 +25,33 @@ class RegistryParser:
         self.delphi_version = delphi_version
         self.platform = platform
         self.registry_path = f"{self.BDS_REGISTRY_PATH}\\{delphi_version}\\Library\\{platform}"
+        # Lazily opened HKCU\Software\Embarcadero\BDS\{version} handle, shared by
+        # _get_compiler_path() and _expand_variables() for the duration of parse()
+        self._root_key: Optional[winreg.HKEYType] = None
+
+    def _get_root_key(self) -> winreg.HKEYType:
+        """Open the BDS version root key once and cache the handle.
+
+        Returns:
+            Open registry key for HKCU\\Software\\Embarcadero\\BDS\\{version}
+
+        Raises:
+            OSError: If the key cannot be opened
+        """
+        if self._root_key is None:
+            self._root_key = winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER,
+                f"{self.BDS_REGISTRY_PATH}\\{self.delphi_version}",
+                0,
+                winreg.KEY_READ,
+            )
+        return self._root_key
+
+    def close(self) -> None:
+        """Close the cached root key handle, if open."""
+        if self._root_key is not None:
+            winreg.CloseKey(self._root_key)
+            self._root_key = None
 
     def parse(self) -> BuildLogInfo:
         """Parse registry to extract library paths and settings.
@@ -35,49 +63,50 @@ class RegistryParser:
             FileNotFoundError: If registry key not found
             PermissionError: If cannot access registry
         """
-        try:
-            # Open registry key
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER, self.registry_path, 0, winreg.KEY_READ
-            )
-
-            # Read values
-            search_path = self._read_registry_value(key, "Search Path", "")
-            debug_dcu_path = self._read_registry_value(key, "Debug DCU Path", "")
-
-            # Close key
-            winreg.CloseKey(key)
-
-            # Parse paths
-            search_paths = self._parse_path_string(search_path)
-
-            # Add debug paths if present
-            if debug_dcu_path:
-                debug_paths = self._parse_path_string(debug_dcu_path)
-                search_paths.extend(debug_paths)
-
-            # Determine compiler path
-            compiler_path = self._get_compiler_path()
-
-            # Create BuildLogInfo
-            return BuildLogInfo(
-                compiler_path=compiler_path,
-                delphi_version=self.delphi_version,
-                platform=Platform.WIN32 if self.platform == "Win32" else Platform.WIN64,
-                build_config="Release",  # Registry doesn't specify this
-                search_paths=self._deduplicate_paths(search_paths),
-                namespace_prefixes=[],  # Would need to read from another key
-                unit_aliases={},  # Would need to read from another key
-                compiler_flags=[],
-            )
-
-        except FileNotFoundError:
-            raise FileNotFoundError(
-                f"Registry key not found: {self.registry_path}\n"
-                f"Make sure Delphi {self.delphi_version} is installed."
-            )
-        except PermissionError:
-            raise PermissionError(f"Cannot access registry key: {self.registry_path}")
+        with closing(self):
+            try:
+                # Open registry key
+                key = winreg.OpenKey(
+                    winreg.HKEY_CURRENT_USER, self.registry_path, 0, winreg.KEY_READ
+                )
+
+                # Read values
+                search_path = self._read_registry_value(key, "Search Path", "")
+                debug_dcu_path = self._read_registry_value(key, "Debug DCU Path", "")
+
+                # Close key
+                winreg.CloseKey(key)
+
+                # Parse paths
+                search_paths = self._parse_path_string(search_path)
+
+                # Add debug paths if present
+                if debug_dcu_path:
+                    debug_paths = self._parse_path_string(debug_dcu_path)
+                    search_paths.extend(debug_paths)
+
+                # Determine compiler path
+                compiler_path = self._get_compiler_path()
+
+                # Create BuildLogInfo
+                return BuildLogInfo(
+                    compiler_path=compiler_path,
+                    delphi_version=self.delphi_version,
+                    platform=Platform.WIN32 if self.platform == "Win32" else Platform.WIN64,
+                    build_config="Release",  # Registry doesn't specify this
+                    search_paths=self._deduplicate_paths(search_paths),
+                    namespace_prefixes=[],  # Would need to read from another key
+                    unit_aliases={},  # Would need to read from another key
+                    compiler_flags=[],
+                )
+
+            except FileNotFoundError:
+                raise FileNotFoundError(
+                    f"Registry key not found: {self.registry_path}\n"
+                    f"Make sure Delphi {self.delphi_version} is installed."
+                )
+            except PermissionError:
+                raise PermissionError(f"Cannot access registry key: {self.registry_path}")
 
     def _read_registry_value(self, key: winreg.HKEYType, value_name: str, default: str = "") -> str:
         """Read a string value from registry key.
@@ -146,14 +175,7 @@ class RegistryParser:
         """
         # Get BDS (Delphi installation) path from registry
         try:
-            root_key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                f"{self.BDS_REGISTRY_PATH}\\{self.delphi_version}",
-                0,
-                winreg.KEY_READ,
-            )
-            bds_path, _ = winreg.QueryValueEx(root_key, "RootDir")
-            winreg.CloseKey(root_key)
+            bds_path, _ = winreg.QueryValueEx(self._get_root_key(), "RootDir")
         except Exception:
             bds_path = f"C:\\Program Files (x86)\\Embarcadero\\Studio\\{self.delphi_version}"
 
@@ -198,14 +220,7 @@ class RegistryParser:
         """
         # Try to get from registry
         try:
-            root_key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                f"{self.BDS_REGISTRY_PATH}\\{self.delphi_version}",
-                0,
-                winreg.KEY_READ,
-            )
-            bds_path, _ = winreg.QueryValueEx(root_key, "RootDir")
-            winreg.CloseKey(root_key)
+            bds_path, _ = winreg.QueryValueEx(self._get_root_key(), "RootDir")
 
             compiler_name = "dcc32.exe" if self.platform == "Win32" else "dcc64.exe"
             return Path(bds_path) / "bin" / compiler_name
@@ -1,11 +1,119 @@
 """Resource compiler for Delphi version resources."""
 
+import functools
 import subprocess
 from pathlib import Path
 from typing import Optional
 
 from src.models import ResourceCompilationResult, VersionInfo
 
+# Keep cgrc.exe from allocating a console window (flag only exists on Windows)
+_CREATION_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Windows Latin-1 (1252) codepage used in the StringFileInfo block id and Translation
+_VRC_CODEPAGE = "04E4"
+
+
+def _locale_ids(locale: int) -> tuple[str, str]:
+    """Return the (StringFileInfo block id, Translation value) for a locale ID."""
+    lang_hex = f"{locale:04X}"
+    return f"{lang_hex}{_VRC_CODEPAGE}", f"0x{lang_hex} 0x{_VRC_CODEPAGE}"
+
+
+# Block ids and Translation values precomputed for common locales: en-US, de-DE,
+# fr-FR, it-IT, ja-JP, ko-KR, zh-CN, es-ES (traditional), en-GB, pt-BR, es-ES,
+# nl-NL, pl-PL, ru-RU
+_COMMON_LOCALES = (
+    1033, 1031, 1036, 1040, 1041, 1042, 2052, 1034, 2057, 1046, 3082, 1043, 1045, 1049
+)
+_LOCALE_IDS = {locale: _locale_ids(locale) for locale in _COMMON_LOCALES}
+
+# .vrc (Windows RC) version resource script; {string_values} holds the VALUE lines
+_VRC_TEMPLATE = """\
+1 VERSIONINFO
+FILEVERSION {fileversion}
+PRODUCTVERSION {productversion}
+FILEFLAGSMASK 0x3FL
+FILEFLAGS 0x0L
+FILEOS 0x40004L
+FILETYPE 0x1L
+FILESUBTYPE 0x0L
+BEGIN
+  BLOCK "StringFileInfo"
+  BEGIN
+    BLOCK "{block_id}"
+    BEGIN
+{string_values}    END
+  END
+  BLOCK "VarFileInfo"
+  BEGIN
+    VALUE "Translation", {translation}
+  END
+END
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def _render_vrc(
+    major: int,
+    minor: int,
+    release: int,
+    build: int,
+    locale: int,
+    items: tuple[tuple[str, str], ...],
+) -> str:
+    """Render .vrc content from hashable version fields (memoized).
+
+    Args:
+        major: Major version number
+        minor: Minor version number
+        release: Release version number
+        build: Build version number
+        locale: Locale ID
+        items: Version info key-value pairs in output order
+
+    Returns:
+        String containing the .vrc file content (Windows RC format)
+    """
+    version = f"{major},{minor},{release},{build}"
+    block_id, translation = _LOCALE_IDS.get(locale) or _locale_ids(locale)
+    string_values = "".join(
+        f'      VALUE "{key}", "{value or ""}\\0"\n' for key, value in items
+    )
+    return _VRC_TEMPLATE.format_map({
+        "fileversion": version,
+        "productversion": version,
+        "block_id": block_id,
+        "string_values": string_values,
+        "translation": translation,
+    })
+
+
+@functools.lru_cache(maxsize=256)
+def _render_vrc_bytes(
+    major: int,
+    minor: int,
+    release: int,
+    build: int,
+    locale: int,
+    items: tuple[tuple[str, str], ...],
+) -> bytes:
+    """Render .vrc file bytes: UTF-8 with CRLF line endings (memoized).
+
+    Args:
+        major: Major version number
+        minor: Minor version number
+        release: Release version number
+        build: Build version number
+        locale: Locale ID
+        items: Version info key-value pairs in output order
+
+    Returns:
+        Bytes ready to be written to the .vrc file
+    """
+    content = _render_vrc(major, minor, release, build, locale, items)
+    return content.replace("\n", "\r\n").encode("utf-8")
+
 
 class VrcGenerator:
     """Generates .vrc (version resource script) content from VersionInfo."""
@@ -14,6 +122,9 @@ class VrcGenerator:
     def generate(project_name: str, version_info: VersionInfo) -> str:
         """Generate .vrc file content.
 
+        Output is cached by version field values, so regenerating the same
+        version resource skips the formatting work.
+
         Args:
             project_name: Project name (used for default values)
             version_info: Version information
@@ -22,44 +133,25 @@ class VrcGenerator:
             String containing the .vrc file content (Windows RC format)
         """
         vi = version_info
-        locale_hex = f"{vi.locale:04X}"
-        codepage = "04E4"  # Windows Latin-1 (1252)
-
-        lines = [
-            "1 VERSIONINFO",
-            f"FILEVERSION {vi.major},{vi.minor},{vi.release},{vi.build}",
-            f"PRODUCTVERSION {vi.major},{vi.minor},{vi.release},{vi.build}",
-            "FILEFLAGSMASK 0x3FL",
-            "FILEFLAGS 0x0L",
-            "FILEOS 0x40004L",
-            "FILETYPE 0x1L",
-            "FILESUBTYPE 0x0L",
-            "BEGIN",
-            '  BLOCK "StringFileInfo"',
-            "  BEGIN",
-            f'    BLOCK "{locale_hex}{codepage}"',
-            "    BEGIN",
-        ]
+        return _render_vrc(
+            vi.major, vi.minor, vi.release, vi.build, vi.locale, tuple(vi.keys.items())
+        )
 
-        # Add key-value pairs
-        for key, value in vi.keys.items():
-            if value:
-                lines.append(f'      VALUE "{key}", "{value}\\0"')
-            else:
-                lines.append(f'      VALUE "{key}", "\\0"')
+    @staticmethod
+    def generate_bytes(project_name: str, version_info: VersionInfo) -> bytes:
+        """Generate .vrc file content as bytes, ready to write to disk.
 
-        lines.extend([
-            "    END",
-            "  END",
-            '  BLOCK "VarFileInfo"',
-            "  BEGIN",
-            f"    VALUE \"Translation\", 0x{locale_hex} 0x{codepage}",
-            "  END",
-            "END",
-            "",
-        ])
+        Args:
+            project_name: Project name (used for default values)
+            version_info: Version information
 
-        return "\n".join(lines)
+        Returns:
+            UTF-8 encoded .vrc content with CRLF line endings
+        """
+        vi = version_info
+        return _render_vrc_bytes(
+            vi.major, vi.minor, vi.release, vi.build, vi.locale, tuple(vi.keys.items())
+        )
 
 
 class ResourceCompiler:
@@ -100,8 +192,7 @@ class ResourceCompiler:
 
         try:
             # Generate .vrc content
-            vrc_content = VrcGenerator.generate(project_name, version_info)
-            vrc_path.write_text(vrc_content, encoding="utf-8")
+            vrc_path.write_bytes(VrcGenerator.generate_bytes(project_name, version_info))
 
             # Execute cgrc.exe
             command = [
@@ -114,15 +205,18 @@ class ResourceCompiler:
             result = subprocess.run(
                 command,
                 cwd=str(project_dir),
-                capture_output=True,
+                # One pipe for both streams: cgrc may report errors on either
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
                 encoding="utf-8",
                 errors="replace",
                 timeout=30,
+                creationflags=_CREATION_FLAGS,
             )
 
             if result.returncode != 0:
-                error_output = (result.stdout + "\n" + result.stderr).strip()
+                error_output = result.stdout.strip()
                 return ResourceCompilationResult(
                     success=False,
                     error_output=f"Resource compiler failed:\n{error_output}",
@@ -150,3 +244,25 @@ class ResourceCompiler:
                     vrc_path.unlink()
                 except OSError:
                     pass
+
+    def compile_version_resources(
+        self,
+        items: list[tuple[str, VersionInfo]],
+        project_dir: Path,
+    ) -> list[ResourceCompilationResult]:
+        """Compile several version resources in the same directory.
+
+        cgrc.exe accepts a single script per invocation, so each resource is
+        compiled by its own process.
+
+        Args:
+            items: (project_name, version_info) pairs to compile
+            project_dir: Directory receiving the .vrc and .res files
+
+        Returns:
+            One ResourceCompilationResult per item, in input order
+        """
+        return [
+            self.compile_version_resource(project_name, project_dir, version_info)
+            for project_name, version_info in items
+        ]
@@ -0,0 +1,34 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from src.config import clear_config_lookup_cache
+from src.resource_compiler import VrcGenerator
+
+
+@pytest.fixture(scope="session")
+def cgrc_root(tmp_path_factory):
+    """Fake Delphi root containing bin/cgrc.exe, created once per session."""
+    root = tmp_path_factory.mktemp("delphi")
+    (root / "bin").mkdir()
+    (root / "bin" / "cgrc.exe").touch()
+    return root
+
+
+@pytest.fixture
+def vrc_lines():
+    """Return a helper that generates .vrc content as indentation-stripped lines."""
+
+    def _make(project_name, version_info):
+        content = VrcGenerator.generate(project_name, version_info)
+        return [line.strip() for line in content.splitlines()]
+
+    return _make
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_lookup_cache():
+    """Keep cached config file lookups from leaking between tests."""
+    clear_config_lookup_cache()
+    yield
+    clear_config_lookup_cache()
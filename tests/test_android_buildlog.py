@@ -1,6 +1,5 @@
 """Tests for Android build log parsing."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -47,13 +46,7 @@ class TestAndroidBuildLogParsing:
     """Tests for Android build log parsing."""
 
     def _parse_log(self, content: str):
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".log", delete=False, encoding="utf-8"
-        ) as f:
-            f.write(content)
-            f.flush()
-            parser = BuildLogParser(Path(f.name))
-            return parser.parse()
+        return BuildLogParser.from_text(content).parse()
 
     def test_android64_platform_detected(self):
         info = self._parse_log(ANDROID64_DEBUG_LOG)
@@ -1,11 +1,9 @@
 """Tests for build log parsing: resource compiler extraction and Linux64 flags."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from src.buildlog_parser import BuildLogParser
+from src.models import BuildLogInfo
 
 
 # Minimal build log with cgrc.exe line (German format, matching real logs)
@@ -40,33 +38,25 @@ Erzeugen
 """
 
 
+def _parse_log(content: str) -> BuildLogInfo:
+    return BuildLogParser.from_text(content).parse()
+
+
 class TestBuildLogResourceCompiler:
     """Tests for cgrc.exe extraction from build logs."""
 
-    def _parse_log(self, content: str) -> "BuildLogInfo":
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".log", delete=False, encoding="utf-8"
-        ) as f:
-            f.write(content)
-            f.flush()
-            parser = BuildLogParser(Path(f.name))
-            return parser.parse()
-
-    def test_extracts_cgrc_path_german(self):
-        """Test cgrc.exe path extracted from German build log."""
-        info = self._parse_log(BUILD_LOG_WITH_CGRC)
-        assert info.resource_compiler_path is not None
-        assert "cgrc.exe" in str(info.resource_compiler_path)
-
-    def test_extracts_cgrc_path_english(self):
-        """Test cgrc.exe path extracted from English build log."""
-        info = self._parse_log(BUILD_LOG_WITH_CGRC_EN)
+    @pytest.mark.parametrize(
+        "content", [BUILD_LOG_WITH_CGRC, BUILD_LOG_WITH_CGRC_EN], ids=["german", "english"]
+    )
+    def test_extracts_cgrc_path(self, content):
+        """Test cgrc.exe path extracted from German and English build logs."""
+        info = _parse_log(content)
         assert info.resource_compiler_path is not None
         assert "cgrc.exe" in str(info.resource_compiler_path)
 
     def test_no_cgrc_returns_none(self):
         """Test None when no cgrc.exe in build log."""
-        info = self._parse_log(BUILD_LOG_NO_CGRC)
+        info = _parse_log(BUILD_LOG_NO_CGRC)
         assert info.resource_compiler_path is None
 
 
@@ -89,44 +79,35 @@ Erfolg
 class TestBuildLogLinux64Flags:
     """Tests for Linux64-specific flag extraction from build logs."""
 
-    def _parse_log(self, content: str) -> "BuildLogInfo":
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".log", delete=False, encoding="utf-8"
-        ) as f:
-            f.write(content)
-            f.flush()
-            parser = BuildLogParser(Path(f.name))
-            return parser.parse()
-
     def test_syslibroot_not_in_compiler_flags(self):
         """--syslibroot must not appear in compiler_flags (extracted separately as SDK option)."""
-        info = self._parse_log(BUILD_LOG_LINUX64)
+        info = _parse_log(BUILD_LOG_LINUX64)
         assert "--syslibroot" not in info.compiler_flags
 
     def test_libpath_not_in_compiler_flags(self):
         """--libpath must not appear in compiler_flags (extracted separately as SDK option)."""
-        info = self._parse_log(BUILD_LOG_LINUX64)
+        info = _parse_log(BUILD_LOG_LINUX64)
         assert "--libpath" not in info.compiler_flags
 
     def test_no_config_still_in_flags(self):
         """--no-config should still be extracted as a compiler flag."""
-        info = self._parse_log(BUILD_LOG_LINUX64)
+        info = _parse_log(BUILD_LOG_LINUX64)
         assert "--no-config" in info.compiler_flags
 
     def test_sdk_sysroot_extracted(self):
         """SDK sysroot should be extracted from --syslibroot."""
-        info = self._parse_log(BUILD_LOG_LINUX64)
+        info = _parse_log(BUILD_LOG_LINUX64)
         assert info.sdk_sysroot is not None
         assert "ubuntu22.04.sdk" in str(info.sdk_sysroot)
 
     def test_sdk_libpaths_extracted(self):
         """SDK library paths should be extracted from --libpath."""
-        info = self._parse_log(BUILD_LOG_LINUX64)
+        info = _parse_log(BUILD_LOG_LINUX64)
         assert len(info.sdk_libpaths) > 0
         libpath_strs = [str(p) for p in info.sdk_libpaths]
         assert any("x86_64-linux-gnu" in s for s in libpath_strs)
 
     def test_platform_detected_as_linux64(self):
         """Platform should be detected as Linux64."""
-        info = self._parse_log(BUILD_LOG_LINUX64)
+        info = _parse_log(BUILD_LOG_LINUX64)
         assert info.platform.value == "Linux64"
@@ -1,15 +1,10 @@
 """Tests for ConfigExtender class."""
 
-import os
-import sys
-import tempfile
+import shutil
 from pathlib import Path
 
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.config_extender import ConfigExtender
 
 
@@ -78,204 +73,190 @@ Build succeeded
 """
 
 
-@pytest.fixture
-def temp_config_file():
-    """Create a temporary config file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-        f.write(SAMPLE_CONFIG)
-        temp_path = f.name
-    yield Path(temp_path)
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+# Fixture file contents, encoded once at import
+_SAMPLE_CONFIG_BYTES = SAMPLE_CONFIG.encode("utf-8")
+_SAMPLE_BUILD_LOG_WIN64X_BYTES = SAMPLE_BUILD_LOG_WIN64X.encode("utf-8")
+_SAMPLE_BUILD_LOG_LINUX64_BYTES = SAMPLE_BUILD_LOG_LINUX64.encode("utf-8")
 
+# Substrings checked in the generated config, built once at import
+_WIN64X_PRESERVED = frozenset({'version = "23.0"', "lib_win32_release", "lib_win64_debug"})
+_WIN64X_LIB_PATHS = frozenset({"lib_win64x_debug", "lib_win64x_release"})
+_LINUX_SDK_REQUIRED = frozenset({b"[linux_sdk]", b"sysroot", b"libpaths"})
 
-@pytest.fixture
-def temp_build_log_win64x():
-    """Create a temporary build log for Win64x."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
-        f.write(SAMPLE_BUILD_LOG_WIN64X)
-        temp_path = f.name
-    yield Path(temp_path)
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+
+@pytest.fixture(scope="session")
+def _fixture_templates(tmp_path_factory):
+    """Write the sample config and build logs once per session."""
+    template_dir = tmp_path_factory.mktemp("templates")
+    templates = {
+        "config.toml": _SAMPLE_CONFIG_BYTES,
+        "win64x.log": _SAMPLE_BUILD_LOG_WIN64X_BYTES,
+        "linux64.log": _SAMPLE_BUILD_LOG_LINUX64_BYTES,
+    }
+    for name, content in templates.items():
+        (template_dir / name).write_bytes(content)
+    return template_dir
+
+
+@pytest.fixture(scope="session")
+def sample_config_path(_fixture_templates):
+    """Sample config file (read-only, shared across tests)."""
+    return _fixture_templates / "config.toml"
 
 
 @pytest.fixture
-def temp_build_log_linux64():
-    """Create a temporary build log for Linux64."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".log", delete=False) as f:
-        f.write(SAMPLE_BUILD_LOG_LINUX64)
-        temp_path = f.name
-    yield Path(temp_path)
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+def temp_config_file(sample_config_path, tmp_path):
+    """Create a per-test copy of the sample config file for tests that modify it."""
+    config_path = tmp_path / "config.toml"
+    shutil.copyfile(sample_config_path, config_path)
+    return config_path
+
+
+@pytest.fixture(scope="session")
+def temp_build_log_win64x(_fixture_templates):
+    """Sample build log for Win64x (read-only, shared across tests)."""
+    return _fixture_templates / "win64x.log"
+
+
+@pytest.fixture(scope="session")
+def temp_build_log_linux64(_fixture_templates):
+    """Sample build log for Linux64 (read-only, shared across tests)."""
+    return _fixture_templates / "linux64.log"
+
+
+@pytest.fixture(scope="module")
+def extender():
+    """Shared ConfigExtender; it keeps no state between extend calls."""
+    return ConfigExtender(use_env_vars=False)
+
+
+@pytest.fixture(scope="module")
+def win64x_run(extender, sample_config_path, temp_build_log_win64x, tmp_path_factory):
+    """Extend the sample config with the Win64x build log once.
+
+    Returns:
+        Tuple of (ExtendConfigResult, written config content)
+    """
+    output_path = tmp_path_factory.mktemp("win64x_run") / "delphi_config.toml"
+    result = extender.extend_from_build_log(
+        existing_config_path=sample_config_path,
+        build_log_path=temp_build_log_win64x,
+        output_path=output_path,
+    )
+    return result, output_path.read_text(encoding="utf-8")
 
 
 @pytest.fixture
-def temp_output_file():
-    """Create a temporary output file path."""
-    temp_path = Path(tempfile.mktemp(suffix=".toml"))
-    yield temp_path
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+def temp_output_file(tmp_path):
+    """Output file path inside the per-test tmp_path."""
+    return tmp_path / "output.toml"
+
+
+@pytest.mark.parametrize(
+    "path1,path2",
+    [("C:\\Libraries\\Spring4D\\Source", "C:/LIBRARIES/spring4d/source")],
+)
+def test_path_normalization(extender, path1, path2):
+    """Test case-insensitive path comparison."""
+    norm1 = extender._normalize_path_for_comparison(path1)
+    norm2 = extender._normalize_path_for_comparison(path2)
+
+    assert norm1 == norm2
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [(Path("C:/Libraries/Spring4D/Source"), "spring4d_source")],
+)
+def test_library_naming(extender, path, expected):
+    """Test unique name generation for new libraries."""
+    assert extender._derive_library_name(path) == expected
+
+
+@pytest.mark.parametrize(
+    "name,used_names,expected",
+    [("library", {"library", "library_2"}, "library_3")],
+)
+def test_make_unique_name(extender, name, used_names, expected):
+    """Test unique name generation with suffix."""
+    assert extender._make_unique_name(name, used_names) == expected
 
 
 class TestConfigExtender:
     """Tests for ConfigExtender class."""
 
-    def test_extend_adds_new_platform(
-        self, temp_config_file, temp_build_log_win64x, temp_output_file
-    ):
+    def test_extend_adds_new_platform(self, win64x_run):
         """Test that extending config with a Windows platform succeeds.
 
         Windows targets (Win32/Win64/Win64x) are compiled via MSBuild.  The
         extender therefore only updates the [delphi] root_path/version and does
         NOT add system lib paths or search paths for Windows platforms.
         """
-        extender = ConfigExtender(use_env_vars=False)
-        result = extender.extend_from_build_log(
-            existing_config_path=temp_config_file,
-            build_log_path=temp_build_log_win64x,
-            output_path=temp_output_file,
-        )
+        result, content = win64x_run
 
         assert result.success
 
         # Delphi root_path is already present in the sample config so nothing changes
         # No system lib paths should be added for Windows platforms
-        with open(temp_output_file, "r") as f:
-            content = f.read()
-        assert "lib_win64x_debug" not in content
-        assert "lib_win64x_release" not in content
+        present = [token for token in _WIN64X_LIB_PATHS if token in content]
+        assert not present, present
 
-    def test_extend_skips_duplicates(
-        self, temp_config_file, temp_build_log_win64x, temp_output_file
-    ):
+    def test_extend_skips_duplicates(self, win64x_run):
         """Test that Windows platform extension skips all search paths."""
-        extender = ConfigExtender(use_env_vars=False)
-        result = extender.extend_from_build_log(
-            existing_config_path=temp_config_file,
-            build_log_path=temp_build_log_win64x,
-            output_path=temp_output_file,
-        )
+        result, _ = win64x_run
 
         assert result.success
         # Windows platforms skip all path merging — paths_skipped stays 0
         assert result.paths_skipped == 0
         assert result.paths_added == 0
 
-    def test_extend_preserves_existing(
-        self, temp_config_file, temp_build_log_win64x, temp_output_file
-    ):
+    def test_extend_preserves_existing(self, win64x_run):
         """Test that existing settings are preserved."""
-        extender = ConfigExtender(use_env_vars=False)
-        result = extender.extend_from_build_log(
-            existing_config_path=temp_config_file,
-            build_log_path=temp_build_log_win64x,
-            output_path=temp_output_file,
-        )
+        result, content = win64x_run
 
         assert result.success
 
-        # Read output and verify existing settings preserved
-        with open(temp_output_file, "r") as f:
-            content = f.read()
-
-        # Existing delphi version should be preserved
-        assert 'version = "23.0"' in content
-        # Existing lib paths should be preserved
-        assert "lib_win32_release" in content
-        assert "lib_win64_debug" in content
+        # Existing delphi version and lib paths should be preserved
+        missing = [token for token in _WIN64X_PRESERVED if token not in content]
+        assert not missing, missing
 
-    def test_extend_adds_new_libraries(
-        self, temp_config_file, temp_build_log_win64x, temp_output_file
-    ):
+    def test_extend_adds_new_libraries(self, win64x_run):
         """Test that Windows platform extension does NOT add library paths.
 
         Windows targets use MSBuild which manages search paths through the
         .dproj file, so no third-party library paths are merged.
         """
-        extender = ConfigExtender(use_env_vars=False)
-        result = extender.extend_from_build_log(
-            existing_config_path=temp_config_file,
-            build_log_path=temp_build_log_win64x,
-            output_path=temp_output_file,
-        )
+        result, content = win64x_run
 
         assert result.success
         # Windows platform: no library paths are added
         assert result.paths_added == 0
 
         # NewLib from the build log should NOT appear in the config
-        with open(temp_output_file, "r") as f:
-            content = f.read()
         assert "NewLib" not in content and "newlib" not in content
 
-    def test_path_normalization(self):
-        """Test case-insensitive path comparison."""
-        extender = ConfigExtender(use_env_vars=False)
-
-        path1 = "C:\\Libraries\\Spring4D\\Source"
-        path2 = "C:/LIBRARIES/spring4d/source"
-
-        norm1 = extender._normalize_path_for_comparison(path1)
-        norm2 = extender._normalize_path_for_comparison(path2)
-
-        assert norm1 == norm2
-
-    def test_library_naming(self):
-        """Test unique name generation for new libraries."""
-        extender = ConfigExtender(use_env_vars=False)
-
-        path = Path("C:/Libraries/Spring4D/Source")
-        name = extender._derive_library_name(path)
-
-        assert name == "spring4d_source"
-
-    def test_make_unique_name(self):
-        """Test unique name generation with suffix."""
-        extender = ConfigExtender(use_env_vars=False)
-
-        used_names = {"library", "library_2"}
-        unique = extender._make_unique_name("library", used_names)
-
-        assert unique == "library_3"
-
-    def test_missing_config_error(self, temp_build_log_win64x):
+    def test_missing_config_error(self, extender, temp_build_log_win64x):
         """Test proper error for missing config file."""
-        extender = ConfigExtender(use_env_vars=False)
-
-        with pytest.raises(FileNotFoundError) as exc_info:
+        with pytest.raises(FileNotFoundError, match="not found"):
             extender.extend_from_build_log(
                 existing_config_path=Path("nonexistent.toml"),
                 build_log_path=temp_build_log_win64x,
             )
 
-        assert "not found" in str(exc_info.value)
-
-    def test_missing_build_log_error(self, temp_config_file):
+    def test_missing_build_log_error(self, extender, sample_config_path):
         """Test proper error for missing build log."""
-        extender = ConfigExtender(use_env_vars=False)
-
-        with pytest.raises(FileNotFoundError) as exc_info:
+        with pytest.raises(FileNotFoundError, match="not found"):
             extender.extend_from_build_log(
-                existing_config_path=temp_config_file,
+                existing_config_path=sample_config_path,
                 build_log_path=Path("nonexistent.log"),
             )
 
-        assert "not found" in str(exc_info.value)
-
-    def test_overwrites_existing_when_no_output(self, temp_config_file, temp_build_log_win64x):
+    def test_overwrites_existing_when_no_output(
+        self, extender, temp_config_file, temp_build_log_win64x
+    ):
         """Test that existing config is overwritten when no output path specified."""
-        extender = ConfigExtender(use_env_vars=False)
-
         # Read original content
-        with open(temp_config_file, "r") as f:
-            original_content = f.read()
+        original_content = temp_config_file.read_text(encoding="utf-8")
 
         result = extender.extend_from_build_log(
             existing_config_path=temp_config_file,
@@ -287,8 +268,7 @@ class TestConfigExtender:
         assert result.config_file_path == str(temp_config_file.absolute())
 
         # Read updated content
-        with open(temp_config_file, "r") as f:
-            updated_content = f.read()
+        updated_content = temp_config_file.read_text(encoding="utf-8")
 
         # File should have been (re-)written successfully
         # Windows platform: lib_win64x paths are NOT added (MSBuild manages them)
@@ -296,40 +276,23 @@ class TestConfigExtender:
         # Existing paths must still be present
         assert "lib_win32_release" in updated_content
 
-    def test_namespace_merge(self, temp_config_file, temp_build_log_win64x, temp_output_file):
+    def test_namespace_merge(self, win64x_run):
         """Test that namespaces are merged without duplicates."""
-        extender = ConfigExtender(use_env_vars=False)
-        result = extender.extend_from_build_log(
-            existing_config_path=temp_config_file,
-            build_log_path=temp_build_log_win64x,
-            output_path=temp_output_file,
-        )
+        result, content = win64x_run
 
         assert result.success
 
-        # Read output and verify namespaces
-        with open(temp_output_file, "r") as f:
-            content = f.read()
-
         # Both original (System, Winapi, Vcl, Data) and any new ones should be present
         assert "System" in content
         assert "Winapi" in content
 
-    def test_alias_merge(self, temp_config_file, temp_build_log_win64x, temp_output_file):
+    def test_alias_merge(self, win64x_run):
         """Test that aliases are merged, existing not overwritten."""
-        extender = ConfigExtender(use_env_vars=False)
-        result = extender.extend_from_build_log(
-            existing_config_path=temp_config_file,
-            build_log_path=temp_build_log_win64x,
-            output_path=temp_output_file,
-        )
+        result, content = win64x_run
 
         assert result.success
 
-        # Read output and verify alias preserved
-        with open(temp_output_file, "r") as f:
-            content = f.read()
-
+        # Verify alias preserved
         assert "SysUtils" in content
         assert "System.SysUtils" in content
 
@@ -338,50 +301,40 @@ class TestConfigExtenderLinuxSDK:
     """Tests for ConfigExtender Linux SDK handling."""
 
     def test_extend_adds_linux_sdk(
-        self, temp_config_file, temp_build_log_linux64, temp_output_file
+        self, extender, sample_config_path, temp_build_log_linux64, temp_output_file
     ):
         """Test that Linux SDK settings are added."""
-        extender = ConfigExtender(use_env_vars=False)
         result = extender.extend_from_build_log(
-            existing_config_path=temp_config_file,
+            existing_config_path=sample_config_path,
             build_log_path=temp_build_log_linux64,
             output_path=temp_output_file,
         )
 
         assert result.success
 
-        # Read output and verify Linux SDK section
-        with open(temp_output_file, "r") as f:
-            content = f.read()
+        # Read output and verify Linux SDK section (ASCII tokens, no decode needed)
+        content = temp_output_file.read_bytes()
 
-        assert "[linux_sdk]" in content
-        assert "sysroot" in content
-        assert "libpaths" in content
+        missing = [token for token in _LINUX_SDK_REQUIRED if token not in content]
+        assert not missing, missing
 
 
 class TestExtendConfigResult:
     """Tests for ExtendConfigResult model."""
 
-    def test_result_fields(self, temp_config_file, temp_build_log_win64x, temp_output_file):
+    def test_result_fields(self, win64x_run):
         """Test that result contains expected fields."""
-        extender = ConfigExtender(use_env_vars=False)
-        result = extender.extend_from_build_log(
-            existing_config_path=temp_config_file,
-            build_log_path=temp_build_log_win64x,
-            output_path=temp_output_file,
-        )
-
-        assert hasattr(result, "success")
-        assert hasattr(result, "config_file_path")
-        assert hasattr(result, "paths_added")
-        assert hasattr(result, "paths_skipped")
-        assert hasattr(result, "platforms_added")
-        assert hasattr(result, "settings_updated")
-        assert hasattr(result, "message")
-
-        assert isinstance(result.success, bool)
-        assert isinstance(result.paths_added, int)
-        assert isinstance(result.paths_skipped, int)
-        assert isinstance(result.platforms_added, list)
-        assert isinstance(result.settings_updated, dict)
-        assert isinstance(result.message, str)
+        result, _ = win64x_run
+
+        expected_types = {
+            "success": bool,
+            "config_file_path": str,
+            "paths_added": int,
+            "paths_skipped": int,
+            "platforms_added": list,
+            "settings_updated": dict,
+            "message": str,
+        }
+        assert set(expected_types) <= set(type(result).model_fields)
+        for name, expected_type in expected_types.items():
+            assert isinstance(getattr(result, name), expected_type), name
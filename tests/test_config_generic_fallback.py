@@ -7,7 +7,7 @@ from unittest.mock import patch
 
 import pytest
 
-from src.config import find_config_file_for_platform, ConfigLoader
+from src.config import find_config_file_for_platform, ConfigLoader, load_toml, tomllib
 
 # Minimal Windows config content
 MINIMAL_CONFIG = """\
@@ -100,3 +100,19 @@ class TestMinimalConfigLoading:
         assert config.paths.system.rtl is None
         assert config.paths.libraries == {}
         assert config.compiler.flags == {"flags": []}
+
+    def test_load_toml_parses_once_until_file_changes(self, tmp_path, monkeypatch):
+        """Test load_toml reuses the parsed file until it changes on disk."""
+        config_file = tmp_path / "delphi_config.toml"
+        config_file.write_text(MINIMAL_CONFIG)
+        calls = []
+        real_load = tomllib.load
+        monkeypatch.setattr(tomllib, "load", lambda f: calls.append(f) or real_load(f))
+
+        first = load_toml(config_file)
+        assert load_toml(config_file) is first
+        assert len(calls) == 1
+
+        config_file.write_text(FULL_WIN32_CONFIG)
+        assert "compiler" in load_toml(config_file)
+        assert len(calls) == 2
@@ -1,12 +1,12 @@
 """Tests for version info extraction from .dproj files."""
 
-import tempfile
-from pathlib import Path
+import functools
+import hashlib
 
 import pytest
 
 from src.dproj_parser import DProjParser
-from src.models import VersionInfo
+from src.models import DProjSettings, VersionInfo
 
 
 # Minimal .dproj with VerInfo_Keys style (newer format)
@@ -104,94 +104,72 @@ DPROJ_NO_VERINFO = """\
 """
 
 
+@pytest.fixture(scope="session")
+def parse_dproj(tmp_path_factory):
+    """Parse .dproj content, memoized so each distinct content is parsed once."""
+    root = tmp_path_factory.mktemp("dproj")
+
+    @functools.lru_cache(maxsize=32)
+    def _parse(content: str) -> DProjSettings:
+        # One directory per content hash; the file must stay TestApp.dproj
+        # because $(MSBuildProjectName) resolves to the project stem
+        data = content.encode("utf-8")
+        project_dir = root / hashlib.blake2b(data).hexdigest()[:16]
+        project_dir.mkdir(exist_ok=True)
+        dproj_path = project_dir / "TestApp.dproj"
+        dproj_path.write_bytes(data)
+        return DProjParser(dproj_path).parse()
+
+    return _parse
+
+
+class TestDProjVersionNumbers:
+    """Tests for version number extraction across .dproj styles."""
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            # FileVersion in VerInfo_Keys
+            (DPROJ_VERINFO_KEYS, (2, 5, 1, 42)),
+            # Individual VerInfo_MajorVer etc. override FileVersion from keys
+            (DPROJ_VERINFO_INDIVIDUAL, (3, 6, 1, 316)),
+            # VerInfo_IncludeVerInfo=false
+            (DPROJ_VERINFO_DISABLED, None),
+            # No VerInfo at all
+            (DPROJ_NO_VERINFO, None),
+        ],
+        ids=["keys", "individual", "disabled", "none"],
+    )
+    def test_version_numbers(self, content, expected, parse_dproj):
+        """Test version numbers extracted, or None when version info is absent/disabled."""
+        vi = parse_dproj(content).version_info
+        if expected is None:
+            assert vi is None
+        else:
+            assert vi is not None
+            assert (vi.major, vi.minor, vi.release, vi.build) == expected
+
+
 class TestDProjVersionInfoKeys:
     """Tests for VerInfo_Keys style extraction."""
 
-    def _parse_dproj(self, content: str) -> "DProjSettings":
-        with tempfile.TemporaryDirectory() as tmpdir:
-            dproj_path = Path(tmpdir) / "TestApp.dproj"
-            dproj_path.write_text(content, encoding="utf-8")
-            parser = DProjParser(dproj_path)
-            return parser.parse()
-
-    def test_extracts_version_from_keys(self):
-        """Test version numbers extracted from FileVersion in VerInfo_Keys."""
-        settings = self._parse_dproj(DPROJ_VERINFO_KEYS)
-        assert settings.version_info is not None
-        assert settings.version_info.major == 2
-        assert settings.version_info.minor == 5
-        assert settings.version_info.release == 1
-        assert settings.version_info.build == 42
-
-    def test_extracts_locale(self):
+    def test_extracts_locale(self, parse_dproj):
         """Test locale extracted from VerInfo_Locale."""
-        settings = self._parse_dproj(DPROJ_VERINFO_KEYS)
+        settings = parse_dproj(DPROJ_VERINFO_KEYS)
         assert settings.version_info.locale == 1031
 
-    def test_extracts_keys(self):
+    def test_extracts_keys(self, parse_dproj):
         """Test key-value pairs extracted from VerInfo_Keys."""
-        settings = self._parse_dproj(DPROJ_VERINFO_KEYS)
+        settings = parse_dproj(DPROJ_VERINFO_KEYS)
         assert settings.version_info.keys["CompanyName"] == "TestCo"
         assert settings.version_info.keys["FileDescription"] == "Test Application"
         assert settings.version_info.keys["LegalCopyright"] == "Copyright 2024"
 
-    def test_msbuilds_vars_resolved_in_keys(self):
+    def test_msbuilds_vars_resolved_in_keys(self, parse_dproj):
         """Test $(MSBuildProjectName) resolved to project stem in keys."""
         dproj_with_vars = DPROJ_VERINFO_KEYS.replace(
             "FileDescription=Test Application",
             "FileDescription=$(MSBuildProjectName)"
         )
-        settings = self._parse_dproj(dproj_with_vars)
+        settings = parse_dproj(dproj_with_vars)
         assert settings.version_info.keys["FileDescription"] == "TestApp"
-
-
-class TestDProjVersionInfoIndividual:
-    """Tests for individual VerInfo_* property extraction."""
-
-    def _parse_dproj(self, content: str) -> "DProjSettings":
-        with tempfile.TemporaryDirectory() as tmpdir:
-            dproj_path = Path(tmpdir) / "TestApp.dproj"
-            dproj_path.write_text(content, encoding="utf-8")
-            parser = DProjParser(dproj_path)
-            return parser.parse()
-
-    def test_individual_properties_override_keys_version(self):
-        """Test individual VerInfo_MajorVer etc. override FileVersion from keys."""
-        settings = self._parse_dproj(DPROJ_VERINFO_INDIVIDUAL)
-        assert settings.version_info is not None
-        assert settings.version_info.major == 3
-        assert settings.version_info.minor == 6
-        assert settings.version_info.release == 1
-        assert settings.version_info.build == 316
-
-
-class TestDProjVersionInfoDisabled:
-    """Tests for disabled version info."""
-
-    def _parse_dproj(self, content: str) -> "DProjSettings":
-        with tempfile.TemporaryDirectory() as tmpdir:
-            dproj_path = Path(tmpdir) / "TestApp.dproj"
-            dproj_path.write_text(content, encoding="utf-8")
-            parser = DProjParser(dproj_path)
-            return parser.parse()
-
-    def test_disabled_returns_none(self):
-        """Test VerInfo_IncludeVerInfo=false returns None version_info."""
-        settings = self._parse_dproj(DPROJ_VERINFO_DISABLED)
-        assert settings.version_info is None
-
-
-class TestDProjNoVersionInfo:
-    """Tests for projects without version info."""
-
-    def _parse_dproj(self, content: str) -> "DProjSettings":
-        with tempfile.TemporaryDirectory() as tmpdir:
-            dproj_path = Path(tmpdir) / "TestApp.dproj"
-            dproj_path.write_text(content, encoding="utf-8")
-            parser = DProjParser(dproj_path)
-            return parser.parse()
-
-    def test_no_verinfo_returns_none(self):
-        """Test project without VerInfo returns None version_info."""
-        settings = self._parse_dproj(DPROJ_NO_VERINFO)
-        assert settings.version_info is None
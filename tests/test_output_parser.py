@@ -0,0 +1,65 @@
+"""Tests for Delphi compiler output parser."""
+
+from src.output_parser import OutputParser, parse_compiler_output, parse_compiler_output_bytes
+
+
+DCC_OUTPUT = """\
+Embarcadero Delphi for Win32 compiler version 36.0
+Unit1.pas(42,15) Error: E2003 Undeclared identifier: 'Foo'
+Unit1.pas(50) Warning: W1036 Variable 'x' might not have been initialized
+Unit2.pas(7,3) Hinweis: H2164 Variable 'y' wurde deklariert, aber in 'Bar' nie verwendet
+Fatal: F1026 File not found: 'System.pas'
+12345 lines, 2.5 seconds, 1024 bytes code, 512 bytes data.
+"""
+
+
+class TestParseCompilerOutput:
+    """Tests for parse_compiler_output()."""
+
+    def test_keeps_errors_and_fatals(self):
+        """Errors and fatal errors are returned, with and without location."""
+        errors, _ = parse_compiler_output(DCC_OUTPUT)
+        assert [e.error_code for e in errors] == ["E2003", "F1026"]
+        assert errors[0].file == "Unit1.pas"
+        assert errors[0].line == 42
+        assert errors[0].column == 15
+        assert errors[1].file == "(unknown)"
+
+    def test_filters_warnings_and_hints(self):
+        """Warnings and hints are counted but not returned."""
+        _, stats = parse_compiler_output(DCC_OUTPUT)
+        assert stats.warnings_filtered == 1
+        assert stats.hints_filtered == 1
+
+    def test_lines_compiled(self):
+        """Lines compiled summary is picked up."""
+        _, stats = parse_compiler_output(DCC_OUTPUT)
+        assert stats.lines_compiled == 12345
+
+    def test_output_parser_wrapper(self):
+        """OutputParser delegates to parse_compiler_output()."""
+        parser = OutputParser()
+        errors, stats = parser.parse(DCC_OUTPUT)
+        assert (errors, stats) == parse_compiler_output(DCC_OUTPUT)
+        assert parser.errors == errors
+
+    def test_error_code_takes_precedence_over_severity(self):
+        """The code letter decides the message type; severity is the fallback."""
+        errors, stats = parse_compiler_output(
+            "Unit1.pas(1,1) Error: w1036 Variable 'x' might not have been initialized\n"
+            "Unit1.pas(2,1) Fehler: Undeklarierter Bezeichner: 'Foo'\n"
+        )
+        assert stats.warnings_filtered == 1
+        assert len(errors) == 1
+        assert errors[0].error_code is None
+
+    def test_bytes_output_matches_str_output(self):
+        """Parsing undecoded bytes yields the same result as parsing text."""
+        assert parse_compiler_output_bytes(DCC_OUTPUT.encode("utf-8")) == parse_compiler_output(
+            DCC_OUTPUT
+        )
+
+    def test_bytes_output_invalid_utf8(self):
+        """Undecodable bytes in a kept message are replaced, not fatal."""
+        errors, _ = parse_compiler_output_bytes(b"Unit1.pas(3,1) Error: E2003 Bezeichner \xfc\r\n")
+        assert errors[0].message == "Bezeichner \ufffd"
@@ -1,7 +1,6 @@
 """Tests for platform-specific config file functionality."""
 
 import os
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -16,31 +15,30 @@ from src.config import (
 class TestGetPlatformConfigFilename:
     """Tests for get_platform_config_filename function."""
 
-    def test_win32_filename(self):
-        """Test Win32 returns correct filename."""
-        assert get_platform_config_filename("Win32") == "delphi_config_win32.toml"
-
-    def test_win64_filename(self):
-        """Test Win64 returns correct filename."""
-        assert get_platform_config_filename("Win64") == "delphi_config_win64.toml"
-
-    def test_win64x_filename(self):
-        """Test Win64x returns correct filename."""
-        assert get_platform_config_filename("Win64x") == "delphi_config_win64x.toml"
-
-    def test_linux64_filename(self):
-        """Test Linux64 returns correct filename."""
-        assert get_platform_config_filename("Linux64") == "delphi_config_linux64.toml"
-
-    def test_case_insensitive(self):
-        """Test platform names are case-insensitive."""
-        assert get_platform_config_filename("win32") == "delphi_config_win32.toml"
-        assert get_platform_config_filename("WIN64") == "delphi_config_win64.toml"
-        assert get_platform_config_filename("Win64X") == "delphi_config_win64x.toml"
-
-    def test_unknown_platform_fallback(self):
-        """Test unknown platform generates reasonable filename."""
-        assert get_platform_config_filename("OSX64") == "delphi_config_osx64.toml"
+    @pytest.mark.parametrize(
+        "platform,expected",
+        [
+            ("Win32", "delphi_config_win32.toml"),
+            ("Win64", "delphi_config_win64.toml"),
+            ("Win64x", "delphi_config_win64x.toml"),
+            ("Linux64", "delphi_config_linux64.toml"),
+            # Platform names are case-insensitive
+            ("win32", "delphi_config_win32.toml"),
+            ("WIN64", "delphi_config_win64.toml"),
+            ("Win64X", "delphi_config_win64x.toml"),
+            # Unknown platforms still get a reasonable filename
+            ("OSX64", "delphi_config_osx64.toml"),
+        ],
+    )
+    def test_filename(self, platform, expected):
+        """Test each platform maps to its config filename."""
+        assert get_platform_config_filename(platform) == expected
+
+
+@pytest.fixture
+def config_dir(fs):
+    """Empty config directory on the in-memory pyfakefs filesystem."""
+    return Path(fs.create_dir("/delphi_mcp").path)
 
 
 class TestFindConfigFileForPlatform:
@@ -55,65 +53,75 @@ class TestFindConfigFileForPlatform:
         assert path == Path(env_path)
         assert source == "env"
 
-    def test_platform_specific_found(self, monkeypatch):
+    def test_platform_specific_found(self, monkeypatch, config_dir):
         """Test platform-specific config is found when present."""
         monkeypatch.delenv("DELPHI_CONFIG", raising=False)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base_dir = Path(tmpdir)
-            # Create platform-specific config
-            platform_config = base_dir / "delphi_config_win64.toml"
-            platform_config.write_text("# Win64 config")
+        base_dir = config_dir
+        # Create platform-specific config
+        platform_config = base_dir / "delphi_config_win64.toml"
+        platform_config.touch()
 
-            path, source = find_config_file_for_platform(platform="Win64", base_dir=base_dir)
-            assert path == platform_config
-            assert source == "platform"
+        path, source = find_config_file_for_platform(platform="Win64", base_dir=base_dir)
+        assert path == platform_config
+        assert source == "platform"
 
-    def test_no_platform_config_raises_error(self, monkeypatch):
+    def test_no_platform_config_raises_error(self, monkeypatch, config_dir):
         """Test raises FileNotFoundError when no platform-specific or generic config exists."""
         monkeypatch.delenv("DELPHI_CONFIG", raising=False)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base_dir = Path(tmpdir)
-            # No config files at all
+        base_dir = config_dir
+        # No config files at all
 
-            with pytest.raises(FileNotFoundError, match="delphi_config_win64.toml"):
-                find_config_file_for_platform(platform="Win64", base_dir=base_dir)
+        with pytest.raises(FileNotFoundError, match="delphi_config_win64.toml"):
+            find_config_file_for_platform(platform="Win64", base_dir=base_dir)
 
-    def test_win64_generic_fallback_used_when_no_platform_specific(self, monkeypatch):
+    def test_win64_generic_fallback_used_when_no_platform_specific(self, monkeypatch, config_dir):
         """Test Win64 falls back to generic config when no platform-specific config exists."""
         monkeypatch.delenv("DELPHI_CONFIG", raising=False)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base_dir = Path(tmpdir)
-            # Only generic config exists, no platform-specific
-            generic_config = base_dir / "delphi_config.toml"
-            generic_config.write_text("# Generic config")
+        base_dir = config_dir
+        # Only generic config exists, no platform-specific
+        generic_config = base_dir / "delphi_config.toml"
+        generic_config.touch()
 
-            path, source = find_config_file_for_platform(platform="Win64", base_dir=base_dir)
-            assert path == generic_config
-            assert source == "generic"
+        path, source = find_config_file_for_platform(platform="Win64", base_dir=base_dir)
+        assert path == generic_config
+        assert source == "generic"
 
-    def test_no_platform_raises_error(self, monkeypatch):
+    def test_no_platform_raises_error(self, monkeypatch, config_dir):
         """Test raises FileNotFoundError when no platform is specified."""
         monkeypatch.delenv("DELPHI_CONFIG", raising=False)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base_dir = Path(tmpdir)
+        base_dir = config_dir
 
-            with pytest.raises(FileNotFoundError, match="platform must be specified"):
-                find_config_file_for_platform(platform=None, base_dir=base_dir)
+        with pytest.raises(FileNotFoundError, match="platform must be specified"):
+            find_config_file_for_platform(platform=None, base_dir=base_dir)
 
-    def test_missing_platform_config_raises_error(self, monkeypatch):
+    def test_missing_platform_config_raises_error(self, monkeypatch, config_dir):
         """Test raises FileNotFoundError when platform config file is missing."""
         monkeypatch.delenv("DELPHI_CONFIG", raising=False)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base_dir = Path(tmpdir)
-            # No files exist at all
+        base_dir = config_dir
+        # No files exist at all
+
+        with pytest.raises(FileNotFoundError, match="delphi_config_win64.toml"):
+            find_config_file_for_platform(platform="Win64", base_dir=base_dir)
+
+    def test_cached_lookup_sees_new_platform_config(self, monkeypatch, config_dir):
+        """Test a cached generic lookup is invalidated once a platform config is added."""
+        monkeypatch.delenv("DELPHI_CONFIG", raising=False)
+        (config_dir / "delphi_config.toml").touch()
+
+        assert find_config_file_for_platform("Win64", config_dir)[1] == "generic"
+        assert find_config_file_for_platform("Win64", config_dir)[1] == "generic"
+
+        (config_dir / "delphi_config_win64.toml").touch()
+        # Bump the directory mtime explicitly; filesystem timestamps can be coarse
+        mtime_ns = config_dir.stat().st_mtime_ns + 1_000_000_000
+        os.utime(config_dir, ns=(mtime_ns, mtime_ns))
 
-            with pytest.raises(FileNotFoundError, match="delphi_config_win64.toml"):
-                find_config_file_for_platform(platform="Win64", base_dir=base_dir)
+        assert find_config_file_for_platform("Win64", config_dir)[1] == "platform"
 
 
 class TestPlatformConfigNames:
@@ -1,167 +1,101 @@
 """Tests for resource compiler module."""
 
-import tempfile
+import subprocess
+from collections import namedtuple
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
+
+import pytest
 
 from src.models import VersionInfo
-from src.resource_compiler import ResourceCompiler, VrcGenerator
-
-
-class TestVrcGenerator:
-    """Tests for .vrc file content generation."""
-
-    def test_generates_versioninfo_block(self):
-        """Test generated content contains VERSIONINFO block."""
-        vi = VersionInfo(
-            major=1, minor=2, release=3, build=4,
-            locale=1033,
-            keys={"CompanyName": "TestCo", "FileDescription": "TestApp"},
-        )
-        content = VrcGenerator.generate("TestApp", vi)
-        assert "1 VERSIONINFO" in content
-        assert "FILEVERSION 1,2,3,4" in content
-        assert "PRODUCTVERSION 1,2,3,4" in content
-
-    def test_contains_string_file_info(self):
-        """Test generated content contains StringFileInfo block."""
-        vi = VersionInfo(
-            major=1, minor=0, release=0, build=0,
-            keys={"CompanyName": "TestCo", "FileDescription": "TestApp"},
-        )
-        content = VrcGenerator.generate("TestApp", vi)
-        assert 'BLOCK "StringFileInfo"' in content
-        assert 'VALUE "CompanyName"' in content
-        assert 'VALUE "FileDescription"' in content
-
-    def test_contains_var_file_info(self):
-        """Test generated content contains VarFileInfo block."""
-        vi = VersionInfo(locale=1033)
-        content = VrcGenerator.generate("TestApp", vi)
-        assert 'BLOCK "VarFileInfo"' in content
-        assert "VALUE \"Translation\"" in content
-
-    def test_locale_affects_translation(self):
-        """Test locale ID affects Translation value."""
-        vi_us = VersionInfo(locale=1033)  # US English
-        vi_de = VersionInfo(locale=1031)  # German
-        content_us = VrcGenerator.generate("App", vi_us)
-        content_de = VrcGenerator.generate("App", vi_de)
-        assert "0x0409" in content_us  # 1033 = 0x0409
-        assert "0x0407" in content_de  # 1031 = 0x0407
-
-    def test_locale_affects_string_block_id(self):
-        """Test locale ID affects the StringFileInfo block identifier."""
-        vi_us = VersionInfo(locale=1033)
-        vi_de = VersionInfo(locale=1031)
-        content_us = VrcGenerator.generate("App", vi_us)
-        content_de = VrcGenerator.generate("App", vi_de)
-        assert 'BLOCK "040904E4"' in content_us  # 0409 = US English
-        assert 'BLOCK "040704E4"' in content_de  # 0407 = German
-
-    def test_file_version_in_keys(self):
-        """Test FileVersion key matches version numbers."""
-        vi = VersionInfo(
-            major=2, minor=5, release=1, build=42,
-            keys={"FileVersion": "2.5.1.42"},
-        )
-        content = VrcGenerator.generate("App", vi)
-        assert '"2.5.1.42\\0"' in content or '"2.5.1.42' in content
-
-    def test_empty_keys_still_valid(self):
-        """Test generation works with no keys (minimal valid .vrc)."""
-        vi = VersionInfo(major=1, minor=0, release=0, build=0)
-        content = VrcGenerator.generate("App", vi)
-        assert "1 VERSIONINFO" in content
-        assert "FILEVERSION 1,0,0,0" in content
+from src.resource_compiler import _CREATION_FLAGS, ResourceCompiler
+
+# Stand-in for subprocess.CompletedProcess; stderr is None since it is merged into stdout
+_FakeProc = namedtuple("_FakeProc", "returncode stdout stderr")
+_OK = _FakeProc(0, "", None)
+_FAIL = _FakeProc(1, "fatal error RC1015", None)
+
+
+@pytest.fixture
+def mock_run(monkeypatch):
+    """Replace subprocess.run in the resource compiler with a successful mock."""
+    mock = MagicMock(return_value=_OK)
+    monkeypatch.setattr("src.resource_compiler.subprocess.run", mock)
+    return mock
 
 
 class TestResourceCompiler:
     """Tests for ResourceCompiler (cgrc.exe execution)."""
 
-    def test_cgrc_not_found_returns_error(self):
+    def test_cgrc_not_found_returns_error(self, tmp_path):
         """Test error when cgrc.exe does not exist."""
         rc = ResourceCompiler(delphi_root=Path("/nonexistent/delphi"))
         vi = VersionInfo(major=1)
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = rc.compile_version_resource("App", Path(tmpdir), vi)
+        result = rc.compile_version_resource("App", tmp_path, vi)
         assert result.success is False
         assert "not found" in result.error_output
 
-    @patch("src.resource_compiler.subprocess.run")
-    def test_successful_compilation(self, mock_run):
+    def test_successful_compilation(self, mock_run, cgrc_root, tmp_path):
         """Test successful resource compilation."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-            # Create fake cgrc.exe
-            cgrc_dir = tmpdir_path / "bin"
-            cgrc_dir.mkdir()
-            cgrc_path = cgrc_dir / "cgrc.exe"
-            cgrc_path.write_text("fake")
-
-            rc = ResourceCompiler(delphi_root=tmpdir_path)
-            vi = VersionInfo(major=1, minor=0, release=0, build=0)
-            result = rc.compile_version_resource("TestApp", tmpdir_path, vi)
+        rc = ResourceCompiler(delphi_root=cgrc_root)
+        vi = VersionInfo(major=1, minor=0, release=0, build=0)
+        result = rc.compile_version_resource("TestApp", tmp_path, vi)
 
         assert result.success is True
         assert result.res_file is not None
         assert "TestApp.res" in result.res_file
 
-    @patch("src.resource_compiler.subprocess.run")
-    def test_compilation_failure(self, mock_run):
+    def test_compilation_failure(self, mock_run, cgrc_root, tmp_path):
         """Test resource compiler returns non-zero exit code."""
-        mock_run.return_value = MagicMock(
-            returncode=1, stdout="", stderr="fatal error RC1015"
-        )
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-            cgrc_dir = tmpdir_path / "bin"
-            cgrc_dir.mkdir()
-            (cgrc_dir / "cgrc.exe").write_text("fake")
+        mock_run.return_value = _FAIL
 
-            rc = ResourceCompiler(delphi_root=tmpdir_path)
-            vi = VersionInfo(major=1)
-            result = rc.compile_version_resource("App", tmpdir_path, vi)
+        rc = ResourceCompiler(delphi_root=cgrc_root)
+        vi = VersionInfo(major=1)
+        result = rc.compile_version_resource("App", tmp_path, vi)
 
         assert result.success is False
         assert "fatal error" in result.error_output
 
-    @patch("src.resource_compiler.subprocess.run")
-    def test_command_includes_utf8_codepage(self, mock_run):
+    def test_command_includes_utf8_codepage(self, mock_run, cgrc_root, tmp_path):
         """Test cgrc.exe command includes -c65001 for UTF-8."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-            cgrc_dir = tmpdir_path / "bin"
-            cgrc_dir.mkdir()
-            (cgrc_dir / "cgrc.exe").write_text("fake")
-
-            rc = ResourceCompiler(delphi_root=tmpdir_path)
-            vi = VersionInfo(major=1)
-            rc.compile_version_resource("App", tmpdir_path, vi)
+        rc = ResourceCompiler(delphi_root=cgrc_root)
+        vi = VersionInfo(major=1)
+        rc.compile_version_resource("App", tmp_path, vi)
 
         args = mock_run.call_args[0][0]
         assert "-c65001" in args
         assert "-foApp.res" in args
 
-    @patch("src.resource_compiler.subprocess.run")
-    def test_vrc_file_cleaned_up(self, mock_run):
+    def test_output_streams_are_merged(self, mock_run, cgrc_root, tmp_path):
+        """Test cgrc.exe stderr is merged into a single stdout pipe."""
+        rc = ResourceCompiler(delphi_root=cgrc_root)
+        rc.compile_version_resource("App", tmp_path, VersionInfo(major=1))
+
+        kwargs = mock_run.call_args.kwargs
+        assert kwargs["stdout"] == subprocess.PIPE
+        assert kwargs["stderr"] == subprocess.STDOUT
+
+    def test_console_window_is_suppressed(self, mock_run, cgrc_root, tmp_path):
+        """Test cgrc.exe is started with the no-console-window creation flags."""
+        rc = ResourceCompiler(delphi_root=cgrc_root)
+        rc.compile_version_resource("App", tmp_path, VersionInfo(major=1))
+
+        assert mock_run.call_args.kwargs["creationflags"] == _CREATION_FLAGS
+
+    def test_vrc_file_cleaned_up(self, mock_run, cgrc_root, tmp_path):
         """Test .vrc file is deleted after compilation."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        rc = ResourceCompiler(delphi_root=cgrc_root)
+        vi = VersionInfo(major=1)
+        rc.compile_version_resource("App", tmp_path, vi)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-            cgrc_dir = tmpdir_path / "bin"
-            cgrc_dir.mkdir()
-            (cgrc_dir / "cgrc.exe").write_text("fake")
+        vrc_path = tmp_path / "App.vrc"
+        assert not vrc_path.exists()
 
-            rc = ResourceCompiler(delphi_root=tmpdir_path)
-            vi = VersionInfo(major=1)
-            rc.compile_version_resource("App", tmpdir_path, vi)
+    def test_compile_version_resources(self, mock_run, cgrc_root, tmp_path):
+        """Test batch compilation returns one result per resource, in order."""
+        rc = ResourceCompiler(delphi_root=cgrc_root)
+        items = [(name, VersionInfo(major=1)) for name in ("App", "Tool", "Service")]
+        results = rc.compile_version_resources(items, tmp_path)
 
-            vrc_path = tmpdir_path / "App.vrc"
-            assert not vrc_path.exists()
+        assert mock_run.call_count == 3
+        assert [Path(r.res_file).name for r in results] == ["App.res", "Tool.res", "Service.res"]
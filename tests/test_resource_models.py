@@ -35,6 +35,13 @@ class TestVersionInfo:
         vi = VersionInfo(major=1, minor=2, release=3, build=4)
         assert vi.file_version_string == "1.2.3.4"
 
+    def test_hashable(self):
+        """Test instances are hashable and equal instances hash equal."""
+        a = VersionInfo(major=1, minor=2, keys={"CompanyName": "TestCo"})
+        b = VersionInfo(major=1, minor=2, keys={"CompanyName": "TestCo"})
+        assert hash(a) == hash(b)
+        assert len({a, b}) == 1
+
 
 class TestResourceCompilationResult:
     """Tests for ResourceCompilationResult model."""
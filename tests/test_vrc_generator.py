@@ -0,0 +1,106 @@
+"""Tests for .vrc version resource script generation."""
+
+import re
+
+import pytest
+
+from src.models import VersionInfo
+from src.resource_compiler import VrcGenerator
+
+
+# Fixed header of every generated .vrc script
+_VRC_HEADER = re.compile(
+    r"1 VERSIONINFO\nFILEVERSION (\d+,\d+,\d+,\d+)\nPRODUCTVERSION (\d+,\d+,\d+,\d+)\n"
+)
+
+
+class TestVrcGenerator:
+    """Tests for .vrc file content generation."""
+
+    def test_generates_versioninfo_block(self):
+        """Test generated content contains VERSIONINFO block."""
+        vi = VersionInfo(
+            major=1, minor=2, release=3, build=4,
+            locale=1033,
+            keys={"CompanyName": "TestCo", "FileDescription": "TestApp"},
+        )
+        header = _VRC_HEADER.match(VrcGenerator.generate("TestApp", vi))
+        assert header is not None
+        assert header.groups() == ("1,2,3,4", "1,2,3,4")
+
+    def test_contains_string_file_info(self, vrc_lines):
+        """Test generated content contains StringFileInfo block."""
+        vi = VersionInfo(
+            major=1, minor=0, release=0, build=0,
+            keys={"CompanyName": "TestCo", "FileDescription": "TestApp"},
+        )
+        lines = vrc_lines("TestApp", vi)
+        assert 'BLOCK "StringFileInfo"' in lines
+        values = [line for line in lines if line.startswith("VALUE") and "Translation" not in line]
+        assert values == [
+            'VALUE "CompanyName", "TestCo\\0"',
+            'VALUE "FileDescription", "TestApp\\0"',
+        ]
+
+    def test_contains_var_file_info(self, vrc_lines):
+        """Test generated content contains VarFileInfo block."""
+        lines = vrc_lines("TestApp", VersionInfo(locale=1033))
+        block = lines.index('BLOCK "VarFileInfo"')
+        assert lines[block + 2].startswith('VALUE "Translation"')
+
+    @pytest.mark.parametrize(
+        "locale,translation,block_id",
+        [
+            (1033, "0x0409 0x04E4", "040904E4"),  # US English
+            (1031, "0x0407 0x04E4", "040704E4"),  # German
+            (1053, "0x041D 0x04E4", "041D04E4"),  # Swedish (not precomputed)
+        ],
+    )
+    def test_locale_affects_translation_and_block_id(
+        self, vrc_lines, locale, translation, block_id
+    ):
+        """Test locale ID affects the Translation value and StringFileInfo block id."""
+        lines = vrc_lines("App", VersionInfo(locale=locale))
+        assert f'VALUE "Translation", {translation}' in lines
+        assert f'BLOCK "{block_id}"' in lines
+
+    def test_file_version_in_keys(self, vrc_lines):
+        """Test FileVersion key matches version numbers."""
+        vi = VersionInfo(
+            major=2, minor=5, release=1, build=42,
+            keys={"FileVersion": "2.5.1.42"},
+        )
+        assert 'VALUE "FileVersion", "2.5.1.42\\0"' in vrc_lines("App", vi)
+
+    def test_empty_keys_still_valid(self):
+        """Test generation works with no keys (minimal valid .vrc)."""
+        vi = VersionInfo(major=1, minor=0, release=0, build=0)
+        header = _VRC_HEADER.match(VrcGenerator.generate("App", vi))
+        assert header is not None
+        assert header.groups() == ("1,0,0,0", "1,0,0,0")
+
+    def test_key_values_are_not_template_expanded(self):
+        """Test braces in key values are emitted verbatim."""
+        vi = VersionInfo(keys={"Comments": "{major} {values}"})
+        content = VrcGenerator.generate("App", vi)
+        assert 'VALUE "Comments", "{major} {values}\\0"' in content
+
+    def test_equal_version_info_reuses_cached_content(self):
+        """Test equal VersionInfo values return the cached content."""
+        first = VrcGenerator.generate("App", VersionInfo(major=7, keys={"CompanyName": "Co"}))
+        second = VrcGenerator.generate("App", VersionInfo(major=7, keys={"CompanyName": "Co"}))
+        assert first is second
+
+    def test_changed_keys_regenerate_content(self):
+        """Test modifying keys after generation produces fresh content."""
+        vi = VersionInfo(keys={"CompanyName": "Old"})
+        VrcGenerator.generate("App", vi)
+        vi.keys["CompanyName"] = "New"
+        assert 'VALUE "CompanyName", "New\\0"' in VrcGenerator.generate("App", vi)
+
+    def test_generate_bytes_is_utf8_with_crlf(self):
+        """Test generate_bytes encodes generate() output as UTF-8 with CRLF line endings."""
+        vi = VersionInfo(major=1, keys={"CompanyName": "Müller GmbH"})
+        data = VrcGenerator.generate_bytes("App", vi)
+        assert data == VrcGenerator.generate("App", vi).replace("\n", "\r\n").encode("utf-8")
+        assert 'VALUE "CompanyName", "Müller GmbH\\0"\r\n'.encode("utf-8") in data